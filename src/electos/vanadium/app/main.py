@@ -15,4 +15,6 @@ def application() -> FastAPI:
     for item in _routers:
         router = item.router()
         app.include_router(router)
+    # Build (and cache) the OpenAPI schema at startup, not on the first request.
+    app.add_event_handler("startup", app.openapi)
     return app
@@ -7,6 +7,10 @@ from vanadium.app.database import MemoryDataStore
 class Resources:
 
     # Shared storage used by routes.
+    #
+    # Routes are 'async' and call storage methods inline on the event loop.
+    # That's fine for 'MemoryDataStore', which never blocks. A blocking
+    # backend must either be async or have its calls run in an executor.
 
     _storage = None
 
@@ -1,6 +1,8 @@
 from typing import Optional, Union
 
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 
 from vanadium.app.resource import Resources
@@ -16,17 +18,100 @@ from vanadium.model import (
 from vanadium.utils import UniqueIds
 
 
+# --- Types
+
+# VRI responses returned by the routes, declared once and shared across them.
+
+_RegistrationResponse = Union[RequestSuccess, RequestRejection]
+_StatusResponse = Union[RequestAcknowledgement, RequestRejection]
+
+
+# --- Constants
+
+# Shared by all rejections.
+# Built (and validated) once, rejections only differ by transaction ID.
+
+_IDENTITY_LOOKUP_ERROR = Error(
+    Name = RequestError.IDENTITY_LOOKUP_FAILED
+)
+
+_DUPLICATE_DETAILS = [
+    "The transaction ID is already associated to a pending request."
+]
+
+_NOT_FOUND_DETAILS = [
+    "The transaction ID isn't associated with any pending requests."
+]
+
+
+# --- Responses
+
+def _response(
+    status: str,
+    summary: str,
+    response: Union[_RegistrationResponse, _StatusResponse],
+) -> ORJSONResponse:
+    """Route response rendered directly with orjson.
+
+    Returning the response bypasses FastAPI's 'jsonable_encoder' pass.
+    The VRI response model is dumped once, using schema aliases and
+    dropping null fields, as 'SchemaModel' does by default.
+
+    Parameters:
+        `status`: "Success" or "Failure".
+        `summary`: Short description of the outcome.
+        `response`: The official VRI response model.
+    """
+    return ORJSONResponse({
+        "status":   status,
+        "summary":  summary,
+        "response": response.dict(by_alias = True),
+    })
+
+
+# "Request not found" responses differ only by transaction ID.
+# Render one once with a placeholder ID and keep the bytes around it.
+
+_NOT_FOUND_PLACEHOLDER = "{transaction_id}"
+
+_NOT_FOUND_PREFIX, _NOT_FOUND_SUFFIX = _response(
+    "Failure",
+    "Voter registration request not found",
+    RequestRejection.construct(
+        additional_details = _NOT_FOUND_DETAILS,
+        error = [_IDENTITY_LOOKUP_ERROR],
+        transaction_id = _NOT_FOUND_PLACEHOLDER
+    ),
+).body.split(orjson.dumps(_NOT_FOUND_PLACEHOLDER))
+
+
+def _not_found_response(transaction_id: str) -> Response:
+    """Rejection for an unknown transaction ID, from pre-rendered JSON.
+
+    Only the transaction ID is serialized per request.
+    The body is the same as the '_response' rendering of the rejection.
+    """
+    content = _NOT_FOUND_PREFIX + orjson.dumps(transaction_id) + _NOT_FOUND_SUFFIX
+    return Response(content, media_type = ORJSONResponse.media_type)
+
+
 # --- Routes
 
-_router = APIRouter(prefix = "/voter/registration")
+# The storage is a process-wide singleton, look it up once rather than per request.
+_storage = Resources.get_storage()
+
+_router = APIRouter(
+    prefix = "/voter/registration",
+    default_response_class = ORJSONResponse,
+)
 
 @_router.post(
     "/",
-    # response_model = VoterRecordsResponse,
+    # response_model = _RegistrationResponse,
     response_description = "Voter registration response",
     summary = "Initiate a new voter registration request",
 )
-def voter_registration_request(
+async def voter_registration_request(
     item: VoterRecordsRequest
 ):
     """Create a new voter registration request.
@@ -36,44 +121,34 @@ def voter_registration_request(
     # If a transaction ID was provided use it as the unique ID.
     # Otherwise generate one from the current time.
     # (Note: not robust just good enough for testing.)
-    storage = Resources.get_storage()
-    registration_id = storage.insert(item.transaction_id, item)
+    registration_id = _storage.insert(item.transaction_id, item)
     if registration_id:
         status = "Success"
         summary = "Voter registration request created"
-        response = RequestSuccess(
-            Action = [
+        response = RequestSuccess.construct(
+            action = [
                 SuccessAction.REGISTRATION_CREATED,
             ],
-            TransactionId = registration_id
+            transaction_id = registration_id
         )
     else:
         status = "Failure"
         summary = "Voter registration request already exists"
-        response = RequestRejection(
-            AdditionalDetails = [
-                "The transaction ID is already associated to a pending request."
-            ],
-            Error = Error(
-                Name = RequestError.IDENTITY_LOOKUP_FAILED
-            ),
-
-            TransactionId = registration_id
+        response = RequestRejection.construct(
+            additional_details = _DUPLICATE_DETAILS,
+            error = [_IDENTITY_LOOKUP_ERROR],
+            transaction_id = item.transaction_id
         )
-    return {
-        "status":   status,
-        "summary":  summary,
-        "response": response,
-    }
+    return _response(status, summary, response)
 
 
 @_router.get(
     "/{transaction_id}",
-    # response_model = Union[RequestAcknowledgement, RequestRejection],
+    # response_model = _StatusResponse,
     summary = "Check on the status of a pending voter registration request"
 )
-def voter_registration_status(
-    transaction_id,
+async def voter_registration_status(
+    transaction_id: str,
 ):
     """Status of pending voter registration request.
 
@@ -98,39 +173,25 @@ def voter_registration_status(
       (The reason is that there isn't yet any long-term storage.)
     - Lookup is only done through the transaction ID, not through other identifiers.
     """
-    storage = Resources.get_storage()
-    value = storage.lookup(transaction_id)
+    value = _storage.lookup(transaction_id)
     if value:
         status = "Success"
         summary = "Transaction request is in process"
-        response = RequestAcknowledgement(
-            TransactionId = transaction_id
+        response = RequestAcknowledgement.construct(
+            transaction_id = transaction_id
         )
+        return _response(status, summary, response)
     else:
-        status = "Failure"
-        summary = "Voter registration request not found"
-        response = RequestRejection(
-            AdditionalDetails = [
-                "The transaction ID isn't associated with any pending requests."
-            ],
-            Error = Error(
-                Name = RequestError.IDENTITY_LOOKUP_FAILED
-            ),
-            TransactionId = transaction_id
-        )
-    return {
-        "status":   status,
-        "summary":  summary,
-        "response": response,
-    }
+        return _not_found_response(transaction_id)
 
 
 @_router.put(
     "/{transaction_id}",
+    # response_model = _RegistrationResponse,
     summary = "Update a pending voter registration request"
 )
-def voter_registration_update(
-    transaction_id,
+async def voter_registration_update(
+    transaction_id: str,
     item: VoterRecordsRequest,
 ):
     """Update an existing voter registration request.
@@ -146,75 +207,46 @@ def voter_registration_update(
       that has been accepted or rejected, only one that is pending.
     - Lookup is only done through the transaction ID, not through other identifiers.
     """
-    storage = Resources.get_storage()
-    value = storage.update(transaction_id, item)
+    value = _storage.update(transaction_id, item)
     if value:
         status = "Success"
         summary = "Pending transaction request updated(overwritten!)"
-        response = RequestSuccess(
-            Action = [
+        response = RequestSuccess.construct(
+            action = [
                 SuccessAction.REGISTRATION_UPDATED,
             ],
-            TransactionId = transaction_id
+            transaction_id = transaction_id
         )
+        return _response(status, summary, response)
     else:
-        status = "Failure"
-        summary = "Voter registration request not found"
-        response = RequestRejection(
-            AdditionalDetails = [
-                "The transaction ID isn't associated with any pending requests."
-            ],
-            Error = Error(
-                Name = RequestError.IDENTITY_LOOKUP_FAILED
-            ),
-            TransactionId = transaction_id
-        )
-    return {
-        "status":   status,
-        "summary":  summary,
-        "response": response,
-    }
+        return _not_found_response(transaction_id)
 
 
 @_router.delete(
     "/{transaction_id}",
+    # response_model = _RegistrationResponse,
     summary = "Cancel a pending voter registration request"
 )
-def voter_registration_cancel(
-    transaction_id,
+async def voter_registration_cancel(
+    transaction_id: str,
 ):
     """Delete an existing request.
 
     It is an error if there is no record to delete.
     """
-    storage = Resources.get_storage()
-    value = storage.remove(transaction_id)
+    value = _storage.remove(transaction_id)
     if value:
         status = "Success"
         summary = "Transaction request has been cancelled"
-        response = RequestSuccess(
-            Action = [
+        response = RequestSuccess.construct(
+            action = [
                 SuccessAction.REGISTRATION_CANCELLED,
             ],
-            TransactionId = transaction_id
+            transaction_id = transaction_id
         )
+        return _response(status, summary, response)
     else:
-        status = "Failure"
-        summary = "Voter registration request not found"
-        response = RequestRejection(
-            AdditionalDetails = [
-                "The transaction ID isn't associated with any pending requests."
-            ],
-            Error = Error(
-                Name = RequestError.IDENTITY_LOOKUP_FAILED
-            ),
-            TransactionId = transaction_id
-        )
-    return {
-        "status":  status,
-        "summary": summary,
-        "response": response,
-    }
+        return _not_found_response(transaction_id)
 
 
 # --- Router
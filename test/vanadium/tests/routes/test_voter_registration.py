@@ -9,10 +9,16 @@ from fastapi.testclient import TestClient
 import pytest
 
 from vanadium.app.main import application
+from vanadium.app.route.voter_registration import (
+    _not_found_response,
+    _response,
+)
 from vanadium.model import (
+    Error,
     RequestError,
     RequestForm,
     RequestMethod,
+    RequestRejection,
     SuccessAction,
     Voter,
     VoterRequestType,
@@ -34,6 +40,15 @@ VOTER_RECORDS_REQUEST_TESTS = [
     ( "nvra", "jane-doe" ),
 ]
 
+# Transaction IDs are client-supplied, and some need escaping in JSON.
+NOT_FOUND_TRANSACTION_IDS = [
+    "AB12345678",
+    "0bb1bfd7-4316-42be-99d5-9c9e3bb9ccc0",
+    'x"y\\z',
+    "{transaction_id}",
+    "caf\u00e9",
+]
+
 
 # ---
 
@@ -47,6 +62,8 @@ def test_voter_registration_request(package, file):
     data = response.json()
     assert data["response"]["TransactionId"] == transaction_id
     assert data["response"]["Action"][0] == SuccessAction.REGISTRATION_CREATED.value
+    # Null fields are left out of the response body.
+    assert "District" not in data["response"]
     assert data["status"] == "Success"
     assert data["summary"].find("created") != -1
 
@@ -60,10 +77,26 @@ def test_voter_registration_request_without_transaction_id(package, file):
     assert response.status_code == 200
     data = response.json()
     assert data["response"]["Action"][0] == SuccessAction.REGISTRATION_CREATED.value
+    # Null fields are left out of the response body.
+    assert "District" not in data["response"]
     assert data["status"] == "Success"
     assert data["summary"].find("created") != -1
 
 
+@pytest.mark.parametrize("package,file", VOTER_RECORDS_REQUEST_TESTS)
+def test_voter_registration_request_duplicate(package, file):
+    url = "/voter/registration/"
+    body = load_test_data(package, file)
+    transaction_id = body["TransactionId"]
+    response = client.post(url, json = body)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["response"]["TransactionId"] == transaction_id
+    assert data["response"]["Error"][0]["Name"] == RequestError.IDENTITY_LOOKUP_FAILED.value
+    assert data["status"] == "Failure"
+    assert data["summary"].find("already exists") != -1
+
+
 @pytest.mark.parametrize("package,file", VOTER_RECORDS_REQUEST_TESTS)
 def test_voter_registration_check_status(package, file):
     body = load_test_data(package, file)
@@ -87,6 +120,8 @@ def test_voter_registration_update(package, file):
     data = response.json()
     assert data["response"]["TransactionId"] == transaction_id
     assert data["response"]["Action"][0] == SuccessAction.REGISTRATION_UPDATED.value
+    # Null fields are left out of the response body.
+    assert "District" not in data["response"]
     assert data["status"] == "Success"
     assert data["summary"].find("updated") != -1
 
@@ -101,5 +136,72 @@ def test_voter_registration_cancel(package, file):
     data = response.json()
     assert data["response"]["TransactionId"] == transaction_id
     assert data["response"]["Action"][0] == SuccessAction.REGISTRATION_CANCELLED.value
+    # Null fields are left out of the response body.
+    assert "District" not in data["response"]
     assert data["status"] == "Success"
-    assert data["summary"].find("cancelled") != -1
\ No newline at end of file
+    assert data["summary"].find("cancelled") != -1
+
+
+@pytest.mark.parametrize("package,file", VOTER_RECORDS_REQUEST_TESTS)
+def test_voter_registration_check_status_not_found(package, file):
+    body = load_test_data(package, file)
+    transaction_id = body["TransactionId"]
+    url = f"/voter/registration/{transaction_id}"
+    response = client.get(url)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["response"]["TransactionId"] == transaction_id
+    assert data["response"]["Error"][0]["Name"] == RequestError.IDENTITY_LOOKUP_FAILED.value
+    assert data["status"] == "Failure"
+    assert data["summary"].find("not found") != -1
+
+
+@pytest.mark.parametrize("package,file", VOTER_RECORDS_REQUEST_TESTS)
+def test_voter_registration_update_not_found(package, file):
+    body = load_test_data(package, file)
+    transaction_id = body["TransactionId"]
+    url = f"/voter/registration/{transaction_id}"
+    response = client.put(url, json = body)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["response"]["TransactionId"] == transaction_id
+    assert data["response"]["Error"][0]["Name"] == RequestError.IDENTITY_LOOKUP_FAILED.value
+    assert data["status"] == "Failure"
+    assert data["summary"].find("not found") != -1
+
+
+@pytest.mark.parametrize("package,file", VOTER_RECORDS_REQUEST_TESTS)
+def test_voter_registration_cancel_not_found(package, file):
+    body = load_test_data(package, file)
+    transaction_id = body["TransactionId"]
+    url = f"/voter/registration/{transaction_id}"
+    response = client.delete(url)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["response"]["TransactionId"] == transaction_id
+    assert data["response"]["Error"][0]["Name"] == RequestError.IDENTITY_LOOKUP_FAILED.value
+    assert data["status"] == "Failure"
+    assert data["summary"].find("not found") != -1
+
+
+@pytest.mark.parametrize("transaction_id", NOT_FOUND_TRANSACTION_IDS)
+def test_voter_registration_not_found_response_body(transaction_id):
+    expected = _response(
+        "Failure",
+        "Voter registration request not found",
+        RequestRejection(
+            AdditionalDetails = [
+                "The transaction ID isn't associated with any pending requests."
+            ],
+            Error = [
+                Error(
+                    Name = RequestError.IDENTITY_LOOKUP_FAILED
+                ),
+            ],
+            TransactionId = transaction_id
+        ),
+    )
+    response = _not_found_response(transaction_id)
+    assert response.body == expected.body
+    assert response.media_type == expected.media_type
+    assert response.status_code == expected.status_code